@@ -2,25 +2,33 @@ import os
 import json
 import time
 import base64
+import hashlib
 import importlib
 import dataclasses
 import logging
-from asyncio import wait, sleep, gather, Semaphore, FIRST_COMPLETED, create_task
-from typing import Tuple, Awaitable, NoReturn, Callable, Optional
+from asyncio import sleep, gather
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple, Awaitable, Callable, Optional, Union
 from functools import cached_property
 
+import orjson
 from aiohttp import web, ClientResponse, ClientSession, ClientConnectorError, ClientTimeout, TCPConnector
+from yarl import URL
 import asyncio
 
-from Crypto.Signature import pkcs1_15
-from Crypto.Hash import SHA256
-from Crypto.PublicKey import RSA
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey
+from cryptography.hazmat.primitives.serialization import load_pem_public_key
 
 from lib.metrics import Metrics
 from lib.data_types import (
     AuthData,
     JsonDataException,
     RequestMetrics,
+    env_flag,
 )
 
 VERSION = "0.3.0"
@@ -35,16 +43,77 @@ HEALTHCHECK_POLL_INTERVAL = int(os.environ.get("VESPA_HEALTHCHECK_POLL_INTERVAL"
 HEALTHCHECK_TIMEOUT = int(os.environ.get("VESPA_HEALTHCHECK_TIMEOUT", "10"))
 HEALTHCHECK_CONSECUTIVE_FAILURES = int(os.environ.get("VESPA_HEALTHCHECK_CONSECUTIVE_FAILURES", "3"))
 PUBKEY_FETCH_TIMEOUT = int(os.environ.get("VESPA_PUBKEY_TIMEOUT", "10"))
+PUBKEY_FETCH_RETRY_INTERVAL = int(os.environ.get("VESPA_PUBKEY_RETRY_INTERVAL", "2"))
 METRICS_RETRY_DELAY = int(os.environ.get("VESPA_METRICS_RETRY_DELAY", "2"))
 CONNECTION_LIMIT = int(os.environ.get("VESPA_CONNECTION_LIMIT", "100"))
 CONNECTION_LIMIT_PER_HOST = int(os.environ.get("VESPA_CONNECTION_LIMIT_PER_HOST", "20"))
+KEEPALIVE_TIMEOUT = int(os.environ.get("VESPA_KEEPALIVE_TIMEOUT", "60"))
+# Backend session is rebuilt on this cadence (0 disables rotation); the old
+# session lingers at least the grace period and is only closed once idle
+SESSION_ROTATE_INTERVAL = int(os.environ.get("VESPA_SESSION_ROTATE_INTERVAL", "1800"))
+SESSION_ROTATE_GRACE = int(os.environ.get("VESPA_SESSION_ROTATE_GRACE", "300"))
+SESSION_DRAIN_POLL_INTERVAL = 5
+SIGNATURE_CACHE_SIZE = int(os.environ.get("VESPA_SIGNATURE_CACHE_SIZE", "4096"))
+# "Trust localhost" mode: skip signature verification for loopback peers
+# (co-located sidecar deploys). Does not affect non-loopback traffic.
+TRUST_LOOPBACK = env_flag("VESPA_TRUST_LOOPBACK")
+LOOPBACK_ADDRS = ("127.0.0.1", "::1")
+
+# Non-streaming responses larger than this are forwarded chunk-by-chunk
+# instead of being buffered into a single bytes object
+LARGE_BODY_BYTES = int(os.environ.get("VESPA_LARGE_BODY_BYTES", str(1 << 20)))
+# Request bodies with a declared Content-Length above this are rejected
+# with 413 before any bytes are read
+MAX_BODY_BYTES = int(os.environ.get("VESPA_MAX_BODY_BYTES", str(100 * 1024 * 1024)))
+# Chunk size for coalescing non-SSE streaming responses into fewer writes
+STREAM_CHUNK_BYTES = int(os.environ.get("VESPA_STREAM_CHUNK_BYTES", str(64 * 1024)))
+
+# serverless_-prefixed query parameters that carry auth_data
+AUTH_PARAM_KEYS = frozenset({
+    "serverless_cost", "serverless_endpoint", "serverless_reqnum",
+    "serverless_request_idx", "serverless_signature", "serverless_url",
+})
+
+# Content types that always indicate a streaming response
+STREAMING_CONTENT_TYPES = frozenset({
+    "text/event-stream",
+    "application/x-ndjson",
+    "application/stream+json",
+})
+
+
+def json_response(data: dict, status: int = 200) -> web.Response:
+    """Like web.json_response but serialized with orjson (faster under load)"""
+    return web.Response(
+        body=orjson.dumps(data),
+        status=status,
+        content_type="application/json",
+    )
 
 
 def create_tcp_connector(force_close: bool = True) -> TCPConnector:
-    """Create a standard TCP connector with consistent settings"""
+    """Create a standard TCP connector with consistent settings
+
+    Pool size comes from VESPA_CONNECTION_LIMIT / VESPA_CONNECTION_LIMIT_PER_HOST;
+    set either to 0 for unlimited (the real concurrency governor for a single
+    backend is the request queue, not the connector).
+    """
+    if force_close:
+        return TCPConnector(
+            force_close=True,
+            enable_cleanup_closed=True,
+            limit=CONNECTION_LIMIT,
+            limit_per_host=CONNECTION_LIMIT_PER_HOST,
+        )
+    # Keep-alive pool: reuse backend connections instead of paying a TCP
+    # (and TLS) handshake on every forwarded request
     return TCPConnector(
-        force_close=force_close,
+        force_close=False,
         enable_cleanup_closed=True,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        limit=CONNECTION_LIMIT,
+        limit_per_host=CONNECTION_LIMIT_PER_HOST,
+        ttl_dns_cache=300,  # backend hostname rarely changes; skip re-resolution
     )
 
 
@@ -74,9 +143,8 @@ class Backend:
     )
     reqnum = -1
     version = VERSION
-    sem: Semaphore = dataclasses.field(default_factory=Semaphore)
     unsecured: bool = dataclasses.field(
-        default_factory=lambda: os.environ.get("VESPA_UNSECURED", "false").lower() == "true",
+        default_factory=lambda: env_flag("VESPA_UNSECURED"),
     )
     report_addr: str = dataclasses.field(
         default_factory=lambda: os.environ.get("REPORT_ADDR", "https://run.vast.ai")
@@ -90,21 +158,38 @@ class Backend:
         self.metrics._set_version(self.version)
         self.metrics._set_mtoken(self.mtoken)
         self._total_pubkey_fetch_errors = 0
-        self._pubkey = self._fetch_pubkey()
+        # Fetched asynchronously in _start_tracking, before the worker is
+        # marked ready - fetching here would block the event loop
+        self._pubkey: Optional[RSAPublicKey] = None
+        # Retried/replayed requests re-present the same (message, signature)
+        # pair; remembering recent successes skips the RSA verify on repeats.
+        # Only successes are cached (failures are cheap to recompute and
+        # caching them would let garbage poison the table), keyed by a fixed
+        # 16-byte digest so entries stay small regardless of message size.
+        self._sig_cache: OrderedDict = OrderedDict()
+        # RSA verifies run in this pool so the event loop keeps streaming
+        # other responses during the (CPU-bound) modular exponentiation;
+        # OpenSSL releases the GIL, so the verifies truly run in parallel
+        self._verify_pool = ThreadPoolExecutor(
+            max_workers=os.cpu_count(), thread_name_prefix="sig-verify"
+        )
         self.__start_healthcheck: bool = False
         self.__consecutive_healthcheck_failures: int = 0
-
-    @property
-    def pubkey(self) -> Optional[RSA.RsaKey]:
-        if self._pubkey is None:
-            self._pubkey = self._fetch_pubkey()
-        return self._pubkey
+        # Admission gate for allow_parallel_requests=False. A Condition over
+        # an explicit counter (instead of a Semaphore) gives strict FIFO
+        # wakeups and lets _max_concurrency be raised later with a notify
+        self._admission_cv = asyncio.Condition()
+        self._in_flight: int = 0
+        self._max_concurrency: int = 1
+        # Resolved once; both healthcheck loops hit this path for the
+        # lifetime of the worker (relative to the session's base URL)
+        self._healthcheck_path: str = self.healthcheck_endpoint or "/health"
 
     @cached_property
     def session(self):
         """Main session for forwarding requests to backend API"""
         log.debug(f"starting session with {self.backend_url}")
-        connector = create_tcp_connector(force_close=True)  # Required for long running jobs
+        connector = create_tcp_connector(force_close=False)  # Keep-alive: reuse backend connections
         timeout = ClientTimeout(total=None)
         return ClientSession(self.backend_url, timeout=timeout, connector=connector)
 
@@ -115,60 +200,68 @@ class Backend:
         If path is provided, it will be used as the target endpoint.
         Otherwise, the path from auth_data.endpoint will be used.
         """
+        # Pre-parse the fixed target once so aiohttp skips URL parsing on
+        # every request through this handler
+        target = URL(path) if path is not None else None
+
         async def handler_fn(request: web.Request) -> web.StreamResponse:
-            return await self.__handle_request(request, path)
+            return await self.__handle_request(request, target)
 
         return handler_fn
 
+    def __auth_data_from_query(self, request: web.Request) -> AuthData:
+        """Build AuthData from serverless_-prefixed query parameters
+
+        Raises ValueError/TypeError if the numeric fields are malformed.
+        """
+        # Read straight from the multidict - copying it into a dict per
+        # request is a pointless allocation
+        query = request.query
+
+        # Query params are strings, but cost must be numeric to match signature
+        cost_str = query.get("serverless_cost", "1.0")
+        cost = float(cost_str) if '.' in cost_str else int(cost_str)
+
+        return AuthData(
+            cost=cost,  # Convert to number to match autoscaler's signature
+            endpoint=query.get("serverless_endpoint", request.path),
+            reqnum=int(query.get("serverless_reqnum", 0)),
+            request_idx=int(query.get("serverless_request_idx", 0)),
+            signature=query.get("serverless_signature", ""),
+            url=query.get("serverless_url", "")
+        )
+
     async def __parse_and_validate_request(
         self, request: web.Request
-    ) -> Tuple[Optional[AuthData], Optional[dict], Optional[web.Response]]:
-        """Parse and validate incoming request. Returns (auth_data, payload, error_response)"""
+    ) -> Tuple[Optional[AuthData], Optional[Union[dict, bytes]], Optional[web.Response]]:
+        """Parse and validate incoming request. Returns (auth_data, payload, error_response)
+
+        A payload of None (with auth_data set) means the request body should
+        be streamed through to the backend untouched; bytes means the already
+        read body is forwarded verbatim; a dict is re-serialized as JSON.
+        """
         try:
+            # Check if auth_data fields are present in query params (with serverless_ prefix)
+            has_auth_params = not AUTH_PARAM_KEYS.isdisjoint(request.query)
+
             # GET/DELETE/HEAD requests don't have bodies - use query params for auth_data
             if request.method in ["GET", "DELETE", "HEAD"]:
-                # Try to parse auth_data from query parameters (prefixed with serverless_)
-                query_params = dict(request.query)
-
-                # Check if auth_data fields are present in query params (with serverless_ prefix)
-                auth_param_keys = [
-                    "serverless_cost", "serverless_endpoint", "serverless_reqnum",
-                    "serverless_request_idx", "serverless_signature", "serverless_url"
-                ]
-                has_auth_params = any(key in query_params for key in auth_param_keys)
-
                 if has_auth_params:
-                    # Parse auth_data from query parameters
                     try:
-                        # Query params are strings, but cost must be numeric to match signature
-                        cost_str = query_params.get("serverless_cost", "1.0")
-                        cost = float(cost_str) if '.' in cost_str else int(cost_str)
-
-                        auth_data = AuthData(
-                            cost=cost,  # Convert to number to match autoscaler's signature
-                            endpoint=query_params.get("serverless_endpoint", request.path),
-                            reqnum=int(query_params.get("serverless_reqnum", 0)),
-                            request_idx=int(query_params.get("serverless_request_idx", 0)),
-                            signature=query_params.get("serverless_signature", ""),
-                            url=query_params.get("serverless_url", "")
-                        )
+                        auth_data = self.__auth_data_from_query(request)
 
-                        # Validate signature if not unsecured
-                        if not self.unsecured and not self.__check_signature(auth_data):
-                            return None, None, web.json_response(
-                                dict(error="invalid signature"),
-                                status=401
-                            )
+                        # Signature is verified once for all methods in
+                        # __handle_request, which also records the rejection
 
                         # Remaining query params (excluding serverless_ prefixed fields) become payload
                         payload = {
-                            k: v for k, v in query_params.items()
-                            if k not in auth_param_keys
+                            k: v for k, v in request.query.items()
+                            if k not in AUTH_PARAM_KEYS
                         }
 
                         return auth_data, payload, None
                     except (ValueError, TypeError) as e:
-                        return None, None, web.json_response(
+                        return None, None, json_response(
                             dict(error=f"Invalid auth_data in query params: {str(e)}"),
                             status=400
                         )
@@ -185,92 +278,151 @@ class Backend:
                         url=""
                     )
                     # All query params become payload
-                    return auth_data, query_params, None
+                    return auth_data, dict(request.query), None
                 else:
-                    return None, None, web.json_response(
+                    return None, None, json_response(
                         dict(error=f"{request.method} requests require auth_data in query params (serverless_cost, serverless_endpoint, serverless_reqnum, serverless_request_idx, serverless_signature, serverless_url)"),
                         status=400
                     )
 
+            # Reject oversized uploads from the declared Content-Length before
+            # reading (or streaming) a single body byte
+            if request.content_length is not None and request.content_length > MAX_BODY_BYTES:
+                return None, None, json_response(
+                    dict(error=f"request body too large (limit {MAX_BODY_BYTES} bytes)"),
+                    status=413
+                )
+
+            # POST/PUT/PATCH with auth_data in query params: leave the body
+            # untouched so it can be streamed straight through to the backend
+            # without a parse/re-serialize round trip
+            if has_auth_params:
+                try:
+                    auth_data = self.__auth_data_from_query(request)
+                    return auth_data, None, None
+                except (ValueError, TypeError) as e:
+                    return None, None, json_response(
+                        dict(error=f"Invalid auth_data in query params: {str(e)}"),
+                        status=400
+                    )
+
             # POST/PUT/PATCH requests should have JSON body
-            data = await request.json()
+            # (orjson raises a json.JSONDecodeError subclass, caught below)
+            raw = await request.read()
+            data = orjson.loads(raw)
+
+            # Unsecured passthrough: the body IS the payload, so forward the
+            # bytes we already read instead of parse -> dict -> re-serialize
+            if self.unsecured and "auth_data" not in data:
+                log.debug("Passthrough mode: forwarding raw request body")
+                auth_data = AuthData(
+                    cost=1.0,
+                    endpoint=request.path,
+                    reqnum=0,
+                    request_idx=0,
+                    signature="",
+                    url=""
+                )
+                return auth_data, raw, None
+
             auth_data, payload = self.__parse_request(data, request.path)
             return auth_data, payload, None
         except JsonDataException as e:
-            return None, None, web.json_response(data=e.message, status=422)
+            return None, None, json_response(e.message, status=422)
         except json.JSONDecodeError:
-            return None, None, web.json_response(dict(error="invalid JSON"), status=422)
-
-    async def __wait_for_client_disconnect(self, request: web.Request, request_metrics: RequestMetrics) -> NoReturn:
-        """Wait for client disconnect and mark request as canceled"""
-        await request.wait_for_disconnection()
-        log.debug(f"request with reqnum: {request_metrics.reqnum} was canceled")
-        self.metrics._request_canceled(request_metrics)
-        raise asyncio.CancelledError
+            return None, None, json_response(dict(error="invalid JSON"), status=422)
 
     async def __forward_request_to_backend(
         self,
         request: web.Request,
         auth_data: AuthData,
-        payload: dict,
+        payload: Optional[Union[dict, bytes]],
         request_metrics: RequestMetrics,
-        target_path: Optional[str] = None,
+        target_path: Optional[URL] = None,
     ) -> web.StreamResponse:
-        """Forward request to backend and return response"""
+        """Forward request to backend and return response
+
+        payload=None streams the raw request body through to the backend;
+        bytes are sent as-is; a dict is serialized as JSON.
+        """
         try:
             # Determine endpoint to use
             # Priority: explicit target_path > HTTP request path > auth_data.endpoint (for backward compat)
-            endpoint = target_path if target_path else (request.path if request.path else auth_data.endpoint)
+            endpoint = target_path if target_path is not None else (request.path if request.path else auth_data.endpoint)
 
             # Forward request to backend
-            response = await self.__call_api(
-                endpoint=endpoint,
-                method=request.method,
-                payload=payload
-            )
+            if payload is None:
+                # Raw passthrough: the upload is piped to the backend without
+                # ever being buffered or re-serialized here
+                api_call = self.session.request(
+                    request.method,
+                    endpoint,
+                    data=request.content,
+                    headers={"Content-Type": request.content_type},
+                )
+            elif isinstance(payload, bytes):
+                # Body already read (and validated as JSON); forward verbatim
+                api_call = self.session.request(
+                    request.method,
+                    endpoint,
+                    data=payload,
+                    headers={"Content-Type": request.content_type},
+                )
+            else:
+                api_call = self.__call_api(
+                    endpoint=endpoint,
+                    method=request.method,
+                    payload=payload
+                )
 
-            status_code = response.status
-            log.debug(
-                f"request with reqnum:{request_metrics.reqnum} "
-                f"returned status code: {status_code}"
-            )
+            # async with guarantees the connection goes back to the pool even
+            # if the passthrough raises - otherwise error bursts leak
+            # connector slots until GC runs
+            async with api_call as response:
+                status_code = response.status
+                log.debug(
+                    "request with reqnum:%s returned status code: %s",
+                    request_metrics.reqnum, status_code,
+                )
+
+                # Pass through response
+                res = await self.__pass_through_response(request, response)
 
-            # Pass through response
-            res = await self.__pass_through_response(request, response)
             self.metrics._request_success(request_metrics)
             return res
         except Exception as e:
-            log.debug(f"[backend] Request error: {e}")
+            log.debug("[backend] Request error: %s", e)
             self.metrics._request_errored(request_metrics)
             return web.Response(status=500)
 
     async def __handle_request(
         self,
         request: web.Request,
-        target_path: Optional[str] = None,
+        target_path: Optional[URL] = None,
     ) -> web.StreamResponse:
         """Forward requests to the model endpoint as-is"""
         # Parse and validate request
+        # (explicit None check: an aiohttp Response is an empty Mapping and
+        # evaluates falsy, so `if error_response:` would never trigger)
         auth_data, payload, error_response = await self.__parse_and_validate_request(request)
-        if error_response:
+        if error_response is not None:
             return error_response
 
-        # At this point, auth_data and payload must be non-None (or we would have returned error)
-        # Note: payload can be an empty dict {} for GET/DELETE/HEAD requests with no query params
+        # At this point, auth_data must be non-None (or we would have returned error)
+        # Note: payload can be an empty dict {} for GET/DELETE/HEAD requests with
+        # no query params, or None when the raw body is streamed through
         assert auth_data is not None, "auth_data should not be None after error check"
-        assert payload is not None, "payload should not be None after error check"
 
         # Create request metrics
-        workload = float(auth_data.cost)
         request_metrics = RequestMetrics(
             request_idx=auth_data.request_idx,
             reqnum=auth_data.reqnum,
-            workload=workload,
+            workload=auth_data.workload,
             status="Created"
         )
 
         # Validate signature and queue
-        if self.__check_signature(auth_data) is False:
+        if await self.__check_signature(auth_data, request) is False:
             self.metrics._request_reject(request_metrics)
             return web.Response(status=401)
 
@@ -285,46 +437,37 @@ class Backend:
 
             # Acquire semaphore if parallel requests not allowed
             if self.allow_parallel_requests is False:
-                log.debug(f"Waiting to acquire Sem for reqnum:{request_metrics.reqnum}")
-                await self.sem.acquire()
+                log.debug("Waiting for admission slot for reqnum:%s", request_metrics.reqnum)
+                async with self._admission_cv:
+                    await self._admission_cv.wait_for(
+                        lambda: self._in_flight < self._max_concurrency
+                    )
+                    self._in_flight += 1
                 acquired = True
-                log.debug(f"Sem acquired for reqnum:{request_metrics.reqnum}, starting request...")
+                log.debug("Admission slot acquired for reqnum:%s, starting request...", request_metrics.reqnum)
             else:
-                log.debug(f"Starting request for reqnum:{request_metrics.reqnum}")
-
-            # Race between making request and client disconnect
-            done, pending = await wait(
-                [
-                    create_task(self.__forward_request_to_backend(
-                        request, auth_data, payload, request_metrics, target_path
-                    )),
-                    create_task(self.__wait_for_client_disconnect(request, request_metrics)),
-                ],
-                return_when=FIRST_COMPLETED,
-            )
-
-            # Cancel pending tasks
-            for t in pending:
-                t.cancel()
-            await asyncio.gather(*pending, return_exceptions=True)
+                log.debug("Starting request for reqnum:%s", request_metrics.reqnum)
 
-            # Return result from completed task
-            done_task = done.pop()
-            try:
-                return done_task.result()
-            except Exception as e:
-                log.debug(f"Request task raised exception: {e}")
-                return web.Response(status=500)
+            # aiohttp cancels the handler coroutine when the client
+            # disconnects (handler_cancellation=True on the runner), so no
+            # separate disconnect-watcher task is needed
+            return await self.__forward_request_to_backend(
+                request, auth_data, payload, request_metrics, target_path
+            )
         except asyncio.CancelledError:
             # Client is gone. Do not write a response; just unwind.
+            log.debug("request with reqnum: %s was canceled", request_metrics.reqnum)
+            self.metrics._request_canceled(request_metrics)
             return web.Response(status=499)
         except Exception as e:
-            log.debug(f"Exception in main handler loop {e}")
+            log.debug("Exception in main handler loop %s", e)
             return web.Response(status=500)
         finally:
-            # Always release the semaphore if it was acquired
+            # Always release the admission slot if it was acquired
             if acquired:
-                self.sem.release()
+                async with self._admission_cv:
+                    self._in_flight -= 1
+                    self._admission_cv.notify(1)
             self.metrics._request_end(request_metrics)
 
     def __parse_request(self, data: dict, request_path: str = "/") -> Tuple[AuthData, dict]:
@@ -380,82 +523,100 @@ class Backend:
 
         return (parsed_auth_data, parsed_payload)
 
-    async def __call_api(
-        self, endpoint: str, method: str, payload: dict
-    ) -> ClientResponse:
-        """Call the backend API with the given method and payload"""
-        url = endpoint
-        log.debug(f"{method} to endpoint: '{url}', payload: {payload}")
-
-        # Map HTTP methods to session methods
-        method_handlers = {
-            "GET": lambda: self.session.get(url=url, params=payload if payload else None),
-            "POST": lambda: self.session.post(url=url, json=payload),
-            "PUT": lambda: self.session.put(url=url, json=payload),
-            "PATCH": lambda: self.session.patch(url=url, json=payload),
-            "DELETE": lambda: self.session.delete(url=url, json=payload),
-        }
-
-        # Get handler or default to POST
-        handler = method_handlers.get(method, method_handlers["POST"])
-        return await handler()
+    def __call_api(
+        self, endpoint: Union[str, URL], method: str, payload: dict
+    ) -> Awaitable[ClientResponse]:
+        """Call the backend API with the given method and payload
+
+        Returns the request context manager so callers can use `async with`
+        and release the connection deterministically.
+        """
+        # %-style so the (potentially multi-KB) payload is only stringified
+        # when DEBUG logging is actually enabled
+        log.debug("%s to endpoint: '%s', payload: %s", method, endpoint, payload)
+
+        # aiohttp dispatches on the method string itself; no need for a
+        # per-request dict of lambdas. GET carries the payload as query
+        # params, everything else as a JSON body.
+        if method == "GET":
+            return self.session.request(method, endpoint, params=payload if payload else None)
+        if method not in ("POST", "PUT", "PATCH", "DELETE"):
+            method = "POST"  # unknown methods default to POST, as before
+        return self.session.request(method, endpoint, json=payload)
 
     async def __pass_through_response(
         self, client_request: web.Request, model_response: ClientResponse
     ) -> web.StreamResponse:
         """Pass through the model response to client without transformation"""
 
+        # Read once; repeated .content_type accesses re-check the header
+        content_type = model_response.content_type
+
         if model_response.status != 200:
             # Pass through error responses directly
             content = await model_response.read()
             return web.Response(
                 body=content,
                 status=model_response.status,
-                content_type=model_response.content_type
+                content_type=content_type
             )
 
-        # Check if response is streaming
+        # Check if response is streaming (content_type is already lowercased)
         is_streaming = (
-            model_response.content_type == "text/event-stream"
-            or model_response.content_type == "application/x-ndjson"
+            content_type in STREAMING_CONTENT_TYPES
+            or "stream" in content_type
             or model_response.headers.get("Transfer-Encoding") == "chunked"
-            or "stream" in model_response.content_type.lower()
         )
 
         if is_streaming:
             log.debug("Streaming response detected, proxying chunks...")
             response = web.StreamResponse()
-            response.content_type = model_response.content_type
+            response.content_type = content_type
 
-            # Copy relevant headers
-            for header in ["Transfer-Encoding", "Cache-Control"]:
-                if header in model_response.headers:
-                    response.headers[header] = model_response.headers[header]
+            # Copy relevant headers. Transfer-Encoding is deliberately not
+            # copied: aiohttp sets it for the StreamResponse itself
+            if "Cache-Control" in model_response.headers:
+                response.headers["Cache-Control"] = model_response.headers["Cache-Control"]
 
             await response.prepare(client_request)
 
-            async for chunk in model_response.content.iter_any():
-                await response.write(chunk)
+            if content_type == "text/event-stream":
+                # SSE: forward chunks as they arrive so per-event latency
+                # (time-to-first-token) is not traded for throughput
+                async for chunk in model_response.content.iter_any():
+                    await response.write(chunk)
+            else:
+                # Other streams: coalesce into larger writes to cut
+                # per-chunk syscall and event-loop overhead
+                async for chunk in model_response.content.iter_chunked(STREAM_CHUNK_BYTES):
+                    await response.write(chunk)
 
             await response.write_eof()
             log.debug("Streaming complete")
             return response
-        else:
-            log.debug("Non-streaming response, proxying body...")
-            content = await model_response.read()
-            return web.Response(
-                body=content,
-                status=200,
-                content_type=model_response.content_type
-            )
+        # Large bodies (images, audio): forward in chunks rather than
+        # buffering the whole payload through read()
+        content_length = model_response.content_length
+        if content_length is not None and content_length > LARGE_BODY_BYTES:
+            log.debug("Large response body, proxying chunks...")
+            response = web.StreamResponse()
+            response.content_type = content_type
+            response.content_length = content_length
+            await response.prepare(client_request)
 
-    @cached_property
-    def healthcheck_session(self):
-        """Dedicated session for healthchecks to avoid conflicts with API session"""
-        log.debug("creating dedicated healthcheck session")
-        connector = create_tcp_connector(force_close=True)
-        timeout = ClientTimeout(total=HEALTHCHECK_TIMEOUT)
-        return ClientSession(timeout=timeout, connector=connector)
+            async for chunk in model_response.content.iter_chunked(LARGE_BODY_BYTES):
+                await response.write(chunk)
+
+            await response.write_eof()
+            return response
+
+        log.debug("Non-streaming response, proxying body...")
+        content = await model_response.read()
+        return web.Response(
+            body=content,
+            status=200,
+            content_type=content_type
+        )
 
     async def __wait_for_backend_ready(self, is_resume: bool = False) -> None:
         """Poll healthcheck endpoint until backend is ready or timeout
@@ -464,18 +625,21 @@ class Backend:
             is_resume: If True, use shorter resume timeout (models already on disk).
                       If False, use longer initial timeout (models need to download).
         """
-        # Use configured endpoint or default to /health
-        endpoint = self.healthcheck_endpoint if self.healthcheck_endpoint else "/health"
-        url = f"{self.backend_url}{endpoint}"
+        endpoint = self._healthcheck_path
 
         # Choose timeout based on whether this is initial boot or resume
         timeout = self.ready_timeout_resume if is_resume else self.ready_timeout_initial
         timeout_type = "resume" if is_resume else "initial"
 
-        log.info(f"Waiting for backend to be ready at {url} ({timeout_type} timeout: {timeout}s)")
+        log.info(f"Waiting for backend to be ready at {self.backend_url}{endpoint} ({timeout_type} timeout: {timeout}s)")
 
         start_time = time.time()
 
+        # Exponential backoff from 100ms up to the configured retry interval:
+        # a fixed interval adds up to a full interval of dead time after the
+        # backend actually comes up, which matters for autoscaling warm-up
+        delay = 0.1
+
         while True:
             elapsed = time.time() - start_time
 
@@ -486,7 +650,12 @@ class Backend:
                 raise RuntimeError(error_msg)
 
             try:
-                async with self.healthcheck_session.get(url) as response:
+                # Probes ride the main session (relative path against its base
+                # URL) with a short per-request timeout, so a ready backend
+                # starts serving on an already-warm connection
+                async with self.session.get(
+                    endpoint, timeout=ClientTimeout(total=HEALTHCHECK_TIMEOUT)
+                ) as response:
                     if response.status == 200:
                         log.info(f"Backend is ready! (took {elapsed:.1f}s)")
                         return
@@ -495,7 +664,8 @@ class Backend:
             except Exception as e:
                 log.debug(f"Backend not reachable yet: {e}, retrying...")
 
-            await sleep(HEALTHCHECK_RETRY_INTERVAL)
+            await sleep(delay)
+            delay = min(delay * 1.5, HEALTHCHECK_RETRY_INTERVAL)
 
     async def __healthcheck(self):
         """Periodic healthcheck of the backend with consecutive failure tracking"""
@@ -508,13 +678,21 @@ class Backend:
             if self.__start_healthcheck is False:
                 continue
 
+            # Recent successful traffic already proves the backend is healthy;
+            # skip the probe so it doesn't compete with real requests
+            if time.monotonic() - self.metrics.last_request_success < HEALTHCHECK_POLL_INTERVAL:
+                log.debug("Skipping healthcheck, backend served a request recently")
+                continue
+
             healthcheck_failed = False
             failure_reason = ""
 
             try:
-                log.debug(f"Performing healthcheck on {self.healthcheck_endpoint}")
-                url = f"{self.backend_url}{self.healthcheck_endpoint}"
-                async with self.healthcheck_session.get(url) as response:
+                log.debug("Performing healthcheck on %s", self._healthcheck_path)
+                async with self.session.get(
+                    self._healthcheck_path,
+                    timeout=ClientTimeout(total=HEALTHCHECK_TIMEOUT),
+                ) as response:
                     if response.status == 200:
                         # Success - reset failure counter
                         if self.__consecutive_healthcheck_failures > 0:
@@ -546,8 +724,42 @@ class Backend:
                     # Reset counter so we don't spam error messages
                     self.__consecutive_healthcheck_failures = 0
 
+    async def _rotate_sessions_loop(self) -> None:
+        """Periodically swap in a fresh backend session
+
+        Long-lived keep-alive pools can accumulate connections that the
+        backend has silently recycled; rebuilding the session on a slow
+        cadence keeps the pool healthy. New requests pick up the new session
+        immediately; the old one is closed only once it has drained: the
+        grace period is a floor, after which we wait for the connector to
+        report zero acquired connections. Jobs here can run unbounded
+        (VESPA_TIMEOUT defaults to None), so a timed deadline would truncate
+        live streams mid-body.
+        """
+        if SESSION_ROTATE_INTERVAL <= 0:
+            return
+
+        while True:
+            await sleep(SESSION_ROTATE_INTERVAL)
+            old_session = self.__dict__.pop("session", None)
+            _ = self.session  # re-materialize the cached_property now
+            log.debug("Rotated backend session")
+            if old_session is not None:
+                await sleep(SESSION_ROTATE_GRACE)
+                connector = old_session.connector
+                # no public idle signal on BaseConnector; _acquired holds
+                # the connections currently checked out to requests
+                while connector is not None and len(getattr(connector, "_acquired", ())) > 0:
+                    log.debug("Old backend session still busy, delaying close")
+                    await sleep(SESSION_DRAIN_POLL_INTERVAL)
+                await old_session.close()
+
     async def _start_tracking(self) -> None:
         """Run benchmark, then start background tasks for metrics and healthcheck"""
+        # Fetch the signing key first so the worker can verify requests
+        # as soon as it is marked ready
+        await self._fetch_pubkey()
+
         # Run benchmark first to completion
         await self.__run_benchmark_on_startup()
 
@@ -555,7 +767,8 @@ class Backend:
         await gather(
             self.metrics._send_metrics_loop(),
             self.__healthcheck(),
-            self.metrics._send_delete_requests_loop()
+            self.metrics._send_delete_requests_loop(),
+            self._rotate_sessions_loop(),
         )
 
     def backend_errored(self, msg: str) -> None:
@@ -571,9 +784,15 @@ class Backend:
 
         try:
             with open(BENCHMARK_INDICATOR_FILE, "r") as f:
-                max_throughput = float(f.readline())
+                content = f.read().strip()
+            # A zero-byte cache (write interrupted by shutdown) falls through
+            # to a clean re-benchmark instead of raising into the error path
+            if content:
+                max_throughput = float(content)
                 benchmark_cached = True
                 log.info(f"Benchmark cache found - this is a resume from stopped state")
+            else:
+                log.warning("Benchmark cache is empty - re-running benchmark")
         except FileNotFoundError:
             log.info(f"No benchmark cache - this is initial startup")
 
@@ -611,9 +830,16 @@ class Backend:
                 self.backend_errored(error_msg)
                 raise RuntimeError(error_msg) from e
 
-            # Save benchmark result to cache
-            with open(BENCHMARK_INDICATOR_FILE, "w") as f:
+            # Save benchmark result to cache. Write-then-rename so a shutdown
+            # mid-write can never leave a truncated cache file behind
+            tmp_file = BENCHMARK_INDICATOR_FILE + ".tmp"
+            with open(tmp_file, "w") as f:
                 f.write(str(max_throughput))
+                f.flush()
+                # fsync before the rename: without it a crash can promote a
+                # not-yet-persisted file and force a 1200s re-benchmark
+                os.fsync(f.fileno())
+            os.replace(tmp_file, BENCHMARK_INDICATOR_FILE)
 
         # Ensure max_throughput is set (should never be None at this point)
         assert max_throughput is not None, "max_throughput should not be None after benchmark"
@@ -624,75 +850,121 @@ class Backend:
         log.info(f"Worker ready (benchmark {'cached' if benchmark_cached else 'completed'}), starting periodic healthchecks")
 
     def __verify_signature(self, message: str, signature: str) -> bool:
-        """Verify PKCS#1 signature"""
-        if self.pubkey is None:
+        """Verify PKCS#1 v1.5 / SHA-256 signature via OpenSSL"""
+        if self._pubkey is None:
             log.debug("Signature verification skipped: no public key available")
             return False
 
         try:
-            key = self.pubkey
-            h = SHA256.new(message.encode())
-            pkcs1_15.new(key).verify(h, base64.b64decode(signature))
+            self._pubkey.verify(
+                base64.b64decode(signature),
+                message.encode(),
+                padding.PKCS1v15(),
+                hashes.SHA256(),
+            )
             return True
+        except InvalidSignature:
+            log.debug("Signature does not match message")
+            return False
         except Exception as e:
-            log.debug(f"Signature verification failed: {e}")
+            # malformed base64, wrong key size, etc.
+            log.debug("Signature verification failed: %s", e)
             return False
 
-    def __check_signature(self, auth_data: AuthData) -> bool:
+    async def __check_signature(self, auth_data: AuthData, request: web.Request) -> bool:
         """Verify request signature from autoscaler"""
         if self.unsecured is True:
             return True
 
-        # Include all auth_data fields except signature (matching autoscaler behavior)
-        auth_data_dict = {
-            "cost": auth_data.cost,
-            "endpoint": auth_data.endpoint,
-            "reqnum": auth_data.reqnum,
-            "request_idx": auth_data.request_idx,
-            "url": auth_data.url,
-        }
-
-        # IMPORTANT: Must use indent=4 to match autoscaler's JSON formatting
-        message = json.dumps(auth_data_dict, indent=4, sort_keys=True)
-        log.debug(f"Verifying signature for message: {message}")
-        log.debug(f"Signature: {auth_data.signature[:20]}..." if len(auth_data.signature) > 20 else f"Signature: {auth_data.signature}")
-        result = self.__verify_signature(message, auth_data.signature)
-        if not result:
-            log.debug(f"Signature verification failed for auth_data: {auth_data_dict}")
+        # Trust localhost mode: requests from a co-located sidecar don't need
+        # the (expensive) RSA verify, and the peer address can't be spoofed
+        if TRUST_LOOPBACK and request.remote in LOOPBACK_ADDRS:
+            log.debug("Skipping signature verification for loopback peer")
+            return True
+
+        # Signed message covers all auth_data fields except signature.
+        # IMPORTANT: must be byte-identical to the autoscaler's
+        # json.dumps(..., indent=4, sort_keys=True) output; the field set is
+        # fixed and already in sorted-key order, so the canonical string is
+        # built directly instead of dict + dumps on every request.
+        # json.dumps on the scalars preserves exact escaping/number formatting.
+        message = (
+            "{\n"
+            f'    "cost": {json.dumps(auth_data.cost)},\n'
+            f'    "endpoint": {json.dumps(auth_data.endpoint)},\n'
+            f'    "reqnum": {auth_data.reqnum},\n'
+            f'    "request_idx": {auth_data.request_idx},\n'
+            f'    "url": {json.dumps(auth_data.url)}\n'
+            "}"
+        )
+        log.debug("Verifying signature for message: %s", message)
+        log.debug("Signature: %.20s...", auth_data.signature)
+
+        # Cache key covers message AND signature: a replayed signature on a
+        # different message must still go through the real RSA verify
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(message.encode())
+        digest.update(auth_data.signature.encode())
+        key = digest.digest()
+
+        if key in self._sig_cache:
+            self._sig_cache.move_to_end(key)
+            return True
+
+        result = await asyncio.get_running_loop().run_in_executor(
+            self._verify_pool, self.__verify_signature, message, auth_data.signature
+        )
+        if result:
+            self._sig_cache[key] = None
+            if len(self._sig_cache) > SIGNATURE_CACHE_SIZE:
+                self._sig_cache.popitem(last=False)
+        else:
+            log.debug("Signature verification failed for auth_data: %s", auth_data)
         return result
 
-    def _fetch_pubkey(self) -> Optional[RSA.RsaKey]:
+    async def _fetch_pubkey(self) -> None:
         """
-        Fetch public key from autoscaler synchronously.
+        Fetch public key from autoscaler.
 
-        Note: This is called during __post_init__ (sync context) so we can't use async.
-        Consider refactoring to fetch async during startup instead.
+        Runs on startup (from _start_tracking) before the worker is marked
+        ready, so request handling never blocks on the fetch.
         """
         if self.unsecured:
             log.debug("Running in unsecured mode, skipping pubkey fetch")
-            return None
-
-        try:
-            import requests
-            response = requests.get(
-                f"{self.report_addr}/pubkey/",
-                timeout=PUBKEY_FETCH_TIMEOUT
-            )
-            response.raise_for_status()
-            pubkey_str = response.text
-            log.debug(f"Fetched pubkey: {pubkey_str[:50]}...")
-            return RSA.import_key(pubkey_str)
-        except Exception as e:
-            self._total_pubkey_fetch_errors += 1
-            log.error(f"Failed to fetch pubkey (attempt {self._total_pubkey_fetch_errors}/{MAX_PUBKEY_FETCH_ATTEMPTS}): {e}")
-
-            if self._total_pubkey_fetch_errors >= MAX_PUBKEY_FETCH_ATTEMPTS:
-                error_msg = (
-                    f"Failed to fetch public key after {MAX_PUBKEY_FETCH_ATTEMPTS} attempts. "
-                    f"Cannot verify request signatures. "
-                    f"Set VESPA_UNSECURED=true for local development only."
-                )
-                log.error(error_msg)
-                raise RuntimeError(error_msg)
+            return
 
-            return None
+        url = f"{self.report_addr}/pubkey/"
+        timeout = ClientTimeout(total=PUBKEY_FETCH_TIMEOUT)
+        # The main session is pinned to the backend's base URL; the autoscaler
+        # lives elsewhere, so reuse the metrics session for this one-off fetch
+        session = await self.metrics.http()
+        while True:
+            try:
+                async with session.get(url, timeout=timeout) as response:
+                    response.raise_for_status()
+                    pubkey_str = await response.text()
+                log.debug(f"Fetched pubkey: {pubkey_str[:50]}...")
+                # Parsed once; verification dispatches straight into OpenSSL
+                self._pubkey = load_pem_public_key(pubkey_str.encode())
+                return
+            except Exception as e:
+                self._total_pubkey_fetch_errors += 1
+                log.error(f"Failed to fetch pubkey (attempt {self._total_pubkey_fetch_errors}/{MAX_PUBKEY_FETCH_ATTEMPTS}): {e}")
+
+                if self._total_pubkey_fetch_errors >= MAX_PUBKEY_FETCH_ATTEMPTS:
+                    error_msg = (
+                        f"Failed to fetch public key after {MAX_PUBKEY_FETCH_ATTEMPTS} attempts. "
+                        f"Cannot verify request signatures. "
+                        f"Set VESPA_UNSECURED=true for local development only."
+                    )
+                    log.error(error_msg)
+                    self.backend_errored(error_msg)
+                    raise RuntimeError(error_msg)
+
+                # Exponential backoff: doubles per attempt from the base
+                # retry interval, capped so a flapping autoscaler doesn't
+                # push the worker past its startup window
+                await sleep(min(
+                    PUBKEY_FETCH_RETRY_INTERVAL * 2 ** (self._total_pubkey_fetch_errors - 1),
+                    30,
+                ))
@@ -1,49 +1,84 @@
+import os
 import time
 import logging
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
 from typing import Dict, Any, Optional, Set, Union
-import inspect
 
 import psutil
 
 log = logging.getLogger(__file__)
 
+_TRUTHY = frozenset({"1", "true", "t", "yes", "y", "on"})
+
+
+def env_flag(name: str, default: str = "false") -> bool:
+    """Parse a boolean environment variable via a set lookup
+
+    Accepts the usual spellings (1/true/t/yes/y/on, any case). Used instead
+    of the distutils strtobool that is gone in Python 3.12.
+    """
+    return os.environ.get(name, default).strip().lower() in _TRUTHY
+
 
 class JsonDataException(Exception):
     def __init__(self, json_msg: Dict[str, Any]):
         self.message = json_msg
 
 
-@dataclass
+# slots=True: one of these is built per request, so skip the per-instance
+# __dict__ and make attribute access cheaper
+@dataclass(slots=True)
 class AuthData:
     """data used to authenticate requester"""
 
+    # cost must keep the exact type the autoscaler sent (int vs float changes
+    # the signed JSON message), so the numeric workload is derived once here
+    # instead of coercing cost itself
     cost: Union[str, float, int]  # Can be string or number (autoscaler sends as number)
     endpoint: str
     reqnum: int
     request_idx: int
     signature: str
     url: str
+    workload: float = field(init=False)
+
+    def __post_init__(self):
+        self.workload = float(self.cost)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict of the wire fields
+
+        Cheaper than dataclasses.asdict (no recursive field walk / deepcopy)
+        and deliberately excludes the derived workload field.
+        """
+        return {
+            "cost": self.cost,
+            "endpoint": self.endpoint,
+            "reqnum": self.reqnum,
+            "request_idx": self.request_idx,
+            "signature": self.signature,
+            "url": self.url,
+        }
 
     @classmethod
     def from_json_msg(cls, json_msg: Dict[str, Any]):
-        errors = {}
-        for param in inspect.signature(cls).parameters:
-            if param not in json_msg:
-                errors[param] = "missing parameter"
+        errors = {
+            param: "missing parameter"
+            for param in _AUTH_DATA_FIELDS
+            if param not in json_msg
+        }
         if errors:
             raise JsonDataException(errors)
-        return cls(
-            **{
-                k: v
-                for k, v in json_msg.items()
-                if k in inspect.signature(cls).parameters
-            }
-        )
+        return cls(**{k: json_msg[k] for k in _AUTH_DATA_FIELDS})
+
+
+# Precomputed once: inspect.signature() per request was pure introspection
+# overhead. Only init fields count (workload is derived in __post_init__).
+_AUTH_DATA_FIELDS = frozenset(f.name for f in fields(AuthData) if f.init)
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemMetrics:
     """General system metrics"""
 
@@ -80,7 +115,7 @@ class SystemMetrics:
             self.model_loading_time = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RequestMetrics:
     """Tracks metrics for an active request."""
     request_idx: int
@@ -89,7 +124,7 @@ class RequestMetrics:
     status: str
     success: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class ModelMetrics:
     """Model specific metrics"""
 
@@ -107,6 +142,10 @@ class ModelMetrics:
     requests_working: dict[int, RequestMetrics] = field(default_factory=dict)
     requests_deleting: list[RequestMetrics] = field(default_factory=list)
     last_update: float = field(default_factory=time.time)
+    # running sum of workload in requests_working, maintained by
+    # Metrics._request_start/_request_end so wait_time and cur_load are O(1)
+    # instead of summing the whole dict on every admission check
+    _workload_working_total: float = 0.0
 
     @classmethod
     def empty(cls):
@@ -127,13 +166,13 @@ class ModelMetrics:
 
     @property
     def wait_time(self) -> float:
-        if (len(self.requests_working) == 0):
+        if self._workload_working_total <= 0.0:
             return 0.0
-        return sum([request.workload for request in self.requests_working.values()]) / max(self.max_throughput, 0.00001)
-    
+        return self._workload_working_total / max(self.max_throughput, 0.00001)
+
     @property
     def cur_load(self) -> float:
-        return sum([request.workload for request in self.requests_working.values()])
+        return max(self._workload_working_total, 0.0)
 
     @property
     def working_request_idxs(self) -> list[int]:
@@ -152,7 +191,7 @@ class ModelMetrics:
         self.last_update = time.time()
 
 
-@dataclass
+@dataclass(slots=True)
 class AutoScalerData:
     """Data that is reported to autoscaler"""
 
@@ -2,13 +2,14 @@ import os
 import time
 import logging
 import json
+import orjson
 from asyncio import sleep
 from dataclasses import dataclass, asdict, field
 from functools import cache
 import asyncio
 from aiohttp import ClientSession, ClientTimeout, TCPConnector, ClientResponseError
 
-from lib.data_types import AutoScalerData, SystemMetrics, ModelMetrics, RequestMetrics
+from lib.data_types import AutoScalerData, SystemMetrics, ModelMetrics, RequestMetrics, env_flag
 from typing import Awaitable, NoReturn, List
 
 METRICS_UPDATE_INTERVAL = int(os.environ.get("VESPA_METRICS_UPDATE_INTERVAL", "1"))
@@ -24,7 +25,7 @@ log = logging.getLogger(__file__)
 
 @cache
 def get_url() -> str:
-    use_ssl = os.environ.get("VESPA_USE_SSL", "false") == "true"
+    use_ssl = env_flag("VESPA_USE_SSL")
     worker_port = os.environ[f"VAST_TCP_PORT_{os.environ['VESPA_WORKER_PORT']}"]
     public_ip = os.environ["PUBLIC_IPADDR"]
     return f"http{'s' if use_ssl else ''}://{public_ip}:{worker_port}"
@@ -36,6 +37,8 @@ class Metrics:
     mtoken: str = ""
     last_metric_update: float = 0.0
     last_request_served: float = 0.0
+    # monotonic timestamp of the last successful backend response
+    last_request_success: float = 0.0
     update_pending: bool = False
     id: int = field(default_factory=lambda: int(os.environ["CONTAINER_ID"]))
     report_addr: List[str] = field(
@@ -57,7 +60,9 @@ class Metrics:
             )
             self._session = ClientSession(
                 timeout=ClientTimeout(total=METRICS_TIMEOUT),
-                connector=connector
+                connector=connector,
+                # status reports go out every second; encode them with orjson
+                json_serialize=lambda obj: orjson.dumps(obj).decode(),
             )
         return self._session
     
@@ -72,6 +77,7 @@ class Metrics:
         """
         log.debug("request start")
         request.status = "Started"
+        self.model_metrics._workload_working_total += request.workload
         self.model_metrics.workload_pending += request.workload
         self.model_metrics.workload_received += request.workload
         self.model_metrics.requests_recieved.add(request.reqnum)
@@ -82,6 +88,7 @@ class Metrics:
         """
         this function is called after handling of a request ends, regardless of the outcome
         """
+        self.model_metrics._workload_working_total -= request.workload
         self.model_metrics.workload_pending -= request.workload
         self.model_metrics.requests_working.pop(request.reqnum, None)
         self.model_metrics.requests_deleting.append(request)
@@ -94,6 +101,7 @@ class Metrics:
         self.model_metrics.workload_served += request.workload
         request.status = "Success"
         request.success = True
+        self.last_request_success = time.monotonic()
         self.update_pending = True
 
     def _request_errored(self, request: RequestMetrics) -> None:
@@ -246,25 +254,27 @@ class Metrics:
     async def __send_data_to_autoscaler(self, report_addr: str, loadtime_snapshot: float) -> bool:
         """Send metrics data to a single autoscaler endpoint"""
         data = self.__compute_autoscaler_data(loadtime_snapshot)
-        log_data = asdict(data)
 
-        # Obfuscate token for logging
-        mtoken = log_data.get("mtoken")
-        if mtoken and len(mtoken) > 7:
-            log_data["mtoken"] = mtoken[:7] + "..."
-        elif mtoken:
-            log_data["mtoken"] = "*" * len(mtoken)
-        else:
-            log_data["mtoken"] = ""
-
-        log.debug(
-            "\n".join([
-                "#" * 60,
-                f"sending data to autoscaler",
-                f"{json.dumps(log_data, indent=2)}",
-                "#" * 60,
-            ])
-        )
+        if log.isEnabledFor(logging.DEBUG):
+            log_data = asdict(data)
+
+            # Obfuscate token for logging
+            mtoken = log_data.get("mtoken")
+            if mtoken and len(mtoken) > 7:
+                log_data["mtoken"] = mtoken[:7] + "..."
+            elif mtoken:
+                log_data["mtoken"] = "*" * len(mtoken)
+            else:
+                log_data["mtoken"] = ""
+
+            log.debug(
+                "\n".join([
+                    "#" * 60,
+                    f"sending data to autoscaler",
+                    f"{json.dumps(log_data, indent=2)}",
+                    "#" * 60,
+                ])
+            )
 
         full_path = report_addr.rstrip("/") + "/worker_status/"
         for attempt in range(1, METRICS_MAX_RETRIES + 1):
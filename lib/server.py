@@ -5,7 +5,8 @@ import ssl
 from asyncio import run, gather
 import asyncio
 
-from lib.backend import Backend
+from lib.backend import Backend, MAX_BODY_BYTES
+from lib.data_types import env_flag
 from lib.metrics import Metrics
 from aiohttp import web
 
@@ -15,7 +16,7 @@ log = logging.getLogger(__file__)
 def start_server(backend: Backend, routes: List[web.RouteDef], **kwargs):
     try:
         log.debug("getting certificate...")
-        use_ssl = os.environ.get("VESPA_USE_SSL", "false") == "true"
+        use_ssl = env_flag("VESPA_USE_SSL")
         if use_ssl is True:
             ssl_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
             ssl_context.load_cert_chain(
@@ -25,11 +26,25 @@ def start_server(backend: Backend, routes: List[web.RouteDef], **kwargs):
         else:
             ssl_context = None
 
+        async def close_sessions(app: web.Application) -> None:
+            # The backend session is a cached_property: close it only if it
+            # was ever materialized, then drop the metrics reporting session
+            session = backend.__dict__.get("session")
+            if session is not None:
+                await session.close()
+            await backend.metrics.aclose()
+
         async def main():
             log.debug("starting server...")
-            app = web.Application()
+            # aiohttp defaults to a 1 MiB body cap, which would override the
+            # configured limit; make VESPA_MAX_BODY_BYTES the real bound so
+            # buffered and streamed uploads alike are governed by it
+            app = web.Application(client_max_size=MAX_BODY_BYTES)
             app.add_routes(routes)
-            runner = web.AppRunner(app)
+            app.on_cleanup.append(close_sessions)
+            # Cancel handler coroutines on client disconnect so in-flight
+            # backend calls are abandoned and recorded as cancelled
+            runner = web.AppRunner(app, handler_cancellation=True)
             await runner.setup()
             site = web.TCPSite(
                 runner,
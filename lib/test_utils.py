@@ -9,19 +9,23 @@ Usage:
 """
 import logging
 import os
+import ssl
+import sys
 import time
 import argparse
+import asyncio
 import importlib
 from typing import Callable, List, Dict, Tuple, Any
 from time import sleep
 import threading
 from enum import Enum
-from collections import Counter
-from dataclasses import dataclass, field, asdict
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from functools import cache
 from urllib.parse import urljoin
 from utils.endpoint_util import Endpoint
 from utils.ssl import get_cert_file_path
-import requests
+import aiohttp
 
 from lib.data_types import AuthData
 
@@ -41,16 +45,42 @@ class ClientStatus(Enum):
 
 
 total_success = 0
-last_res = []
+# only the last ten results are ever shown; a bounded deque keeps driver
+# memory flat no matter how many requests the run issues
+last_res = deque(maxlen=10)
 stop_event = threading.Event()
 start_time = time.time()
 
+# Shared counters maintained on every state transition so print_state reads
+# O(|states|) numbers instead of rescanning every client each tick
+_counts_lock = threading.Lock()
+STATUS_COUNTS: Counter = Counter()
+ERROR_COUNTS = {"as": 0, "infer": 0}
+CONN_ERRORS: Counter = Counter()
 
-def print_truncate_res(res: str):
+# Bound every inference call so a hung worker cannot park a client task
+# forever and skew the reported rps. Generations can legitimately take
+# minutes, so the default is generous; override it for fast backends.
+WORKER_TIMEOUT = aiohttp.ClientTimeout(
+    total=float(os.environ.get("VESPA_TEST_WORKER_TIMEOUT", "120")),
+    sock_connect=5,
+)
+ROUTE_TIMEOUT = aiohttp.ClientTimeout(total=4)
+
+@cache
+def _ssl_context() -> ssl.SSLContext:
+    """One parsed trust store for the whole run
+
+    get_cert_file_path downloads the Vast.ai root cert, and building an
+    SSLContext parses the full CA bundle - neither should recur.
+    """
+    return ssl.create_default_context(cafile=get_cert_file_path())
+
+
+def truncate_res(res: str) -> str:
     if len(res) > 150:
-        print(f"{res[:50]}....{res[-100:]}")
-    else:
-        print(res)
+        return f"{res[:50]}....{res[-100:]}"
+    return res
 
 
 @dataclass
@@ -64,80 +94,108 @@ class ClientState:
     status: ClientStatus = ClientStatus.FetchEndpoint
     as_error: List[str] = field(default_factory=list)
     infer_error: List[str] = field(default_factory=list)
-    conn_errors: Counter = field(default_factory=Counter)
 
-    def make_call(self):
-        self.status = ClientStatus.FetchEndpoint
+    def __post_init__(self):
+        # urljoin parses both URLs each call; the route URL never changes,
+        # and neither do the auth header or the fixed route fields
+        self._route_url = urljoin(self.server_url, "/route/")
+        self._headers = {"Authorization": f"Bearer {self.api_key}"}
+        self._route_payload = {
+            "endpoint": self.endpoint_group_name,
+            "api_key": self.api_key,
+        }
+        with _counts_lock:
+            STATUS_COUNTS[self.status] += 1
+
+    def _set_status(self, new_status: ClientStatus) -> None:
+        with _counts_lock:
+            STATUS_COUNTS[self.status] -= 1
+            STATUS_COUNTS[new_status] += 1
+        self.status = new_status
+
+    def _record_as_error(self, msg: str) -> None:
+        self.as_error.append(msg)
+        with _counts_lock:
+            ERROR_COUNTS["as"] += 1
+        self._set_status(ClientStatus.Error)
+
+    def _record_infer_error(self, msg: str) -> None:
+        self.infer_error.append(msg)
+        with _counts_lock:
+            ERROR_COUNTS["infer"] += 1
+        self._set_status(ClientStatus.Error)
+
+    async def make_call(self, session: aiohttp.ClientSession) -> None:
+        self._set_status(ClientStatus.FetchEndpoint)
         if not self.api_key:
-            self.as_error.append(
+            self._record_as_error(
                 f"Endpoint {self.endpoint_group_name} not found for API key",
             )
-            self.status = ClientStatus.Error
             return
 
         # Get test request from benchmark module
         worker_endpoint, payload, workload = self.get_test_request()
 
-        route_payload = {
-            "endpoint": self.endpoint_group_name,
-            "api_key": self.api_key,
-            "cost": workload,
-        }
-        headers = {"Authorization": f"Bearer {self.api_key}"}
-        response = requests.post(
-            urljoin(self.server_url, "/route/"),
+        # only cost varies between calls
+        route_payload = {**self._route_payload, "cost": workload}
+        async with session.post(
+            self._route_url,
             json=route_payload,
-            headers=headers,
-            timeout=4,
-        )
-        if response.status_code != 200:
-            self.as_error.append(
-                f"code: {response.status_code}, body: {response.text}",
-            )
-            self.status = ClientStatus.Error
-            return
-        message = response.json()
+            headers=self._headers,
+            timeout=ROUTE_TIMEOUT,
+        ) as response:
+            if response.status != 200:
+                self._record_as_error(
+                    f"code: {response.status}, body: {await response.text()}",
+                )
+                return
+            message = await response.json(content_type=None)
         worker_address = message["url"]
         req_data = dict(
             payload=payload,
-            auth_data=asdict(AuthData.from_json_msg(message)),
+            auth_data=AuthData.from_json_msg(message).to_dict(),
         )
         self.url = worker_address
-        url = urljoin(worker_address, worker_endpoint)
-        self.status = ClientStatus.Generating
+        # worker_endpoint is always a plain path, so skip urljoin's full RFC
+        # parse on the hot path and just splice the two strings
+        url = worker_address.rstrip("/") + "/" + worker_endpoint.lstrip("/")
+        self._set_status(ClientStatus.Generating)
 
-        response = requests.post(
-            url,
-            json=req_data,
-            verify=get_cert_file_path(),
-        )
-        if response.status_code != 200:
-            self.infer_error.append(
-                f"code: {response.status_code}, body: {response.text}, url: {url}",
-            )
-            self.status = ClientStatus.Error
-            return
-        res = str(response.json())
+        async with session.post(url, json=req_data, timeout=WORKER_TIMEOUT) as response:
+            if response.status != 200:
+                self._record_infer_error(
+                    f"code: {response.status}, body: {await response.text()}, url: {url}",
+                )
+                return
+            res = str(await response.json(content_type=None))
         global total_success
-        global last_res
-        total_success += 1
-        last_res.append(res)
-        self.status = ClientStatus.Done
+        # guarded: print_state reads these from its own thread. Truncate and
+        # number the result here, once, so the refresh loop just prints the
+        # stored lines instead of reformatting them every tick.
+        with _counts_lock:
+            total_success += 1
+            last_res.append(f"res #{total_success}: {truncate_res(res)}")
+        self._set_status(ClientStatus.Done)
 
-    def simulate_user(self) -> None:
+    async def simulate_user(self, session: aiohttp.ClientSession) -> None:
         try:
-            self.make_call()
+            await self.make_call(session)
         except Exception as e:
             print(e)
-            self.status = ClientStatus.Error
+            self._set_status(ClientStatus.Error)
             _ = e
-            self.conn_errors[self.url] += 1
+            with _counts_lock:
+                CONN_ERRORS[self.url] += 1
 
 
 def print_state(clients: List[ClientState], num_clients: int) -> None:
     print("starting up...")
     sleep(2)
     center_size = 14
+    # Refresh fast while client states are changing, back off to 2s when the
+    # table is static; waiting on stop_event keeps the sleep interruptible
+    interval = 0.25
+    prev_snapshot = None
     global start_time
     while len(clients) < num_clients or (
         any(
@@ -148,8 +206,13 @@ def print_state(clients: List[ClientState], num_clients: int) -> None:
             )
         )
     ):
-        sleep(0.5)
-        os.system("clear")
+        if stop_event.is_set():
+            sleep(interval)
+        else:
+            stop_event.wait(timeout=interval)
+        # ANSI clear + home instead of forking a shell for `clear` each tick
+        sys.stdout.write("\x1b[2J\x1b[H")
+        sys.stdout.flush()
         print(
             " | ".join(
                 [member.name.center(center_size) for member in ClientStatus]
@@ -166,35 +229,36 @@ def print_state(clients: List[ClientState], num_clients: int) -> None:
             )
         )
         unique_urls = len(set([c.url for c in clients if c.url != ""]))
-        as_errors = sum(
-            map(
-                lambda client: len(client.as_error),
-                [client for client in clients],
-            )
-        )
-        infer_errors = sum(
-            map(
-                lambda client: len(client.infer_error),
-                [client for client in clients],
-            )
-        )
-        conn_errors = sum([client.conn_errors for client in clients], start=Counter())
+        with _counts_lock:
+            status_counts = [STATUS_COUNTS[member] for member in ClientStatus]
+            as_errors = ERROR_COUNTS["as"]
+            infer_errors = ERROR_COUNTS["infer"]
+            conn_errors = dict(CONN_ERRORS)
+            success_count = total_success
+            # deques raise if mutated while iterated, so snapshot under
+            # the same lock the appender holds
+            res_lines = list(last_res)
         conn_errors_str = ",".join(map(str, conn_errors.values())) or "0"
         elapsed = time.time() - start_time
+
+        snapshot = (tuple(status_counts), as_errors, infer_errors, success_count)
+        if snapshot == prev_snapshot:
+            interval = min(interval * 2, 2.0)
+        else:
+            interval = 0.25
+        prev_snapshot = snapshot
+
         print(
             " | ".join(
                 map(
                     lambda item: str(item).center(center_size),
-                    [
-                        len(list(filter(lambda x: x.status == member, clients)))
-                        for member in ClientStatus
-                    ]
+                    status_counts
                     + [
                         unique_urls,
                         as_errors,
                         infer_errors,
                         conn_errors_str,
-                        f"{total_success}({((total_success/elapsed) * 60):.2f}/minute)",
+                        f"{success_count}({((success_count/elapsed) * 60):.2f}/minute)",
                     ],
                 )
             )
@@ -205,13 +269,53 @@ def print_state(clients: List[ClientState], num_clients: int) -> None:
                 print(url.ljust(28), ": ", str(count))
         elapsed = time.time() - start_time
         print(f"\n elapsed: {int(elapsed // 60)}:{int(elapsed % 60)}")
-        if last_res:
-            for i, res in enumerate(last_res[-10:]):
-                print_truncate_res(f"res #{1+i+max(len(last_res )-10,0)}: {res}")
+        # lines are pre-truncated and pre-numbered at append time
+        for line in res_lines:
+            print(line)
         if stop_event.is_set():
             print("\n### waiting for existing connections to close ###")
 
 
+async def _run_test(
+    num_requests: int,
+    requests_per_second: float,
+    endpoint_group_name: str,
+    endpoint_api_key: str,
+    server_url: str,
+    get_test_request: Callable[[], Tuple[str, Dict[str, Any], float]],
+    instance: str,
+    clients: List[ClientState],
+) -> None:
+    # Simulated clients sit in network waits almost all the time, so one
+    # event loop drives thousands of them far cheaper than a thread each.
+    # All tasks share one session; in-flight concurrency is set by the rate
+    # shaping, not the connector, so the pool is left unbounded.
+    connector = aiohttp.TCPConnector(limit=0, ssl=_ssl_context())
+    tasks = []
+    async with aiohttp.ClientSession(connector=connector) as session:
+        # Deadline scheduling: sleeping a fixed 1/rps between spawns lets
+        # per-iteration overhead accumulate, so the real rate drifts below
+        # the requested one. Pinning each spawn to t0 + i*dt keeps the error
+        # bounded by one sleep resolution instead of growing with i.
+        t0 = time.monotonic()
+        dt = 1.0 / requests_per_second
+        for i in range(num_requests):
+            client = ClientState(
+                endpoint_group_name=endpoint_group_name,
+                api_key=endpoint_api_key,
+                server_url=server_url,
+                get_test_request=get_test_request,
+                instance=instance,
+            )
+            clients.append(client)
+            tasks.append(asyncio.create_task(client.simulate_user(session)))
+            delay = t0 + (i + 1) * dt - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        print("done spawning workers")
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
 def run_test(
     num_requests: int,
     requests_per_second: int,
@@ -221,9 +325,7 @@ def run_test(
     get_test_request: Callable[[], Tuple[str, Dict[str, Any], float]],
     instance: str,
 ):
-    threads = []
-
-    clients = []
+    clients: List[ClientState] = []
     print_thread = threading.Thread(target=print_state, args=(clients, num_requests))
     print_thread.daemon = True  # makes threads get killed on program exit
     print_thread.start()
@@ -234,22 +336,16 @@ def run_test(
         log.debug(f"Endpoint {endpoint_group_name} not found for API key")
         return
     try:
-        for _ in range(num_requests):
-            client = ClientState(
-                endpoint_group_name=endpoint_group_name,
-                api_key=endpoint_api_key,
-                server_url=server_url,
-                get_test_request=get_test_request,
-                instance=instance,
-            )
-            clients.append(client)
-            thread = threading.Thread(target=client.simulate_user, args=())
-            threads.append(thread)
-            thread.start()
-            sleep(1 / requests_per_second)
-        for thread in threads:
-            thread.join()
-        print("done spawning workers")
+        asyncio.run(_run_test(
+            num_requests=num_requests,
+            requests_per_second=requests_per_second,
+            endpoint_group_name=endpoint_group_name,
+            endpoint_api_key=endpoint_api_key,
+            server_url=server_url,
+            get_test_request=get_test_request,
+            instance=instance,
+            clients=clients,
+        ))
     except KeyboardInterrupt:
         stop_event.set()
 
@@ -297,17 +393,20 @@ if __name__ == "__main__":
 
     args = arg_parser.parse_args()
 
-    # Load benchmark module
-    try:
+    # Load benchmark module lazily: it can pull in heavy deps (tokenizers
+    # etc.), so defer the import to the first request instead of paying for
+    # it at startup. @cache makes every later call hit the resolved callable.
+    @cache
+    def _load_get_test_request() -> Callable[[], Tuple[str, Dict[str, Any], float]]:
         benchmark_module = importlib.import_module(args.benchmark_module)
-        if not hasattr(benchmark_module, 'get_test_request'):
+        if not hasattr(benchmark_module, "get_test_request"):
             raise ValueError(
                 f"Benchmark module {args.benchmark_module} does not have get_test_request() function"
             )
-        get_test_request = benchmark_module.get_test_request
-    except Exception as e:
-        log.error(f"Failed to load benchmark module '{args.benchmark_module}': {e}")
-        exit(1)
+        return benchmark_module.get_test_request
+
+    def get_test_request() -> Tuple[str, Dict[str, Any], float]:
+        return _load_get_test_request()()
 
     # Determine server URL
     server_url = {
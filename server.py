@@ -20,6 +20,7 @@ import importlib
 from typing import Optional, Callable, Awaitable, cast
 from aiohttp import web, ClientSession
 from lib.backend import Backend
+from lib.data_types import env_flag
 from lib.server import start_server
 
 # Configure logging from environment variable
@@ -78,7 +79,7 @@ def load_benchmark_function() -> Optional[Callable[[str, ClientSession], Awaitab
 # Load configuration from environment
 backend_url = os.environ.get("VESPA_BACKEND_URL", "http://localhost:8000")
 healthcheck_endpoint = os.environ.get("VESPA_HEALTHCHECK_ENDPOINT")
-allow_parallel = os.environ.get("VESPA_ALLOW_PARALLEL", "true").lower() == "true"
+allow_parallel = env_flag("VESPA_ALLOW_PARALLEL", "true")
 max_wait_time = float(os.environ.get("VESPA_MAX_WAIT_TIME", "10.0"))
 
 # Load benchmark function
@@ -102,14 +103,14 @@ async def handle_ping(_):
 # Create catch-all route that forwards any path to the backend
 # The actual backend endpoint path comes from the HTTP request path
 # auth_data.endpoint contains the Vast endpoint name (for signature verification only)
+# One handler closure shared by every method: create_handler allocates
+# per-handler state, so registering five separate instances wastes memory
+handler = backend.create_handler()
 routes = [
     # Catch-all route for all HTTP methods
     # Forwards request.path to the backend API
-    web.post("/{path:.*}", backend.create_handler()),
-    web.get("/{path:.*}", backend.create_handler()),
-    web.put("/{path:.*}", backend.create_handler()),
-    web.patch("/{path:.*}", backend.create_handler()),
-    web.delete("/{path:.*}", backend.create_handler()),
+    web.route(method, "/{path:.*}", handler)
+    for method in ("POST", "GET", "PUT", "PATCH", "DELETE")
 ]
 
 # Add ping endpoint for testing (doesn't require auth)